@@ -1,4 +1,7 @@
 # app/auth.py
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
 from passlib.context import CryptContext
@@ -6,23 +9,126 @@ from app.config import settings
 
 pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
 def hash_secret(secret: str) -> str:
     return pwd_ctx.hash(secret)
 
 def verify_secret(secret: str, hashed: str) -> bool:
     return pwd_ctx.verify(secret, hashed)
 
-def create_access_token(subject: str, expires_minutes: int = None):
+def _signing_keys():
+    # kid -> secret; the active key always wins over a stale entry with the same kid
+    keys = dict(settings.JWT_PREVIOUS_KEYS)
+    keys[settings.JWT_ACTIVE_KID] = settings.SECRET_KEY
+    return keys
+
+_keys = _signing_keys()
+
+def _encode(claims: dict, expires_minutes: int) -> str:
+    now = datetime.utcnow()
+    to_encode = dict(claims, iat=now, exp=now + timedelta(minutes=expires_minutes))
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM,
+                      headers={"kid": settings.JWT_ACTIVE_KID})
+
+def create_access_token(subject: str, roles=None, expires_minutes: int = None):
     if expires_minutes is None:
         expires_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    expire = datetime.utcnow() + timedelta(minutes=expires_minutes)
-    to_encode = {"sub": str(subject), "exp": expire}
-    encoded = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded
+    claims = {"sub": str(subject), "typ": ACCESS_TOKEN_TYPE}
+    if roles is not None:
+        # Embedded so require_roles can authorize without a DB round trip
+        claims["roles"] = [getattr(r, "value", r) for r in roles]
+    return _encode(claims, expires_minutes)
 
-def decode_access_token(token: str):
+def create_refresh_token(subject: str, expires_minutes: int = None):
+    if expires_minutes is None:
+        expires_minutes = settings.REFRESH_TOKEN_EXPIRE_MINUTES
+    return _encode({"sub": str(subject), "typ": REFRESH_TOKEN_TYPE}, expires_minutes)
+
+class TokenCache:
+    """Bounded LRU of already-verified tokens, keyed by SHA-256 digest.
+
+    Entries are dropped once the token's own ``exp`` passes, so a hit never
+    outlives what a full signature check would have accepted.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def get(self, digest: bytes):
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        payload, exp = entry
+        if exp <= time.time():
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return payload
+
+    def put(self, digest: bytes, payload: dict):
+        if self.maxsize <= 0:
+            return
+        self._entries[digest] = (payload, payload.get("exp", 0))
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+token_cache = TokenCache(settings.TOKEN_CACHE_SIZE)
+
+def _verify(token: str):
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload.get("sub")
+        kid = jwt.get_unverified_header(token).get("kid")
     except JWTError:
         return None
+    # Tokens issued before kid headers existed were signed with SECRET_KEY
+    key = _keys.get(kid) if kid else settings.SECRET_KEY
+    if key is None:
+        return None
+    try:
+        return jwt.decode(token, key, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+
+def decode_token(token: str, token_type: str = ACCESS_TOKEN_TYPE):
+    """Return the verified claims of ``token`` or None if invalid, expired or of another type."""
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(digest)
+    if payload is None:
+        payload = _verify(token)
+        if payload is None:
+            return None
+        token_cache.put(digest, payload)
+    # Legacy tokens carry no typ claim and were always access tokens
+    if payload.get("typ", ACCESS_TOKEN_TYPE) != token_type:
+        return None
+    return payload
+
+def decode_access_token(token: str):
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    return payload.get("sub")
+
+# user id -> when their roles last changed; role claims issued before that are stale
+_roles_changed_at = {}
+
+def mark_roles_changed(user_id: str):
+    now = time.time()
+    _roles_changed_at[str(user_id)] = now
+    # Older marks can no longer match a live access token
+    horizon = now - settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    for uid in [u for u, t in _roles_changed_at.items() if t < horizon]:
+        del _roles_changed_at[uid]
+
+def role_claims_current(payload: dict) -> bool:
+    changed = _roles_changed_at.get(payload.get("sub"))
+    return changed is None or payload.get("iat", 0) > changed
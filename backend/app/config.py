@@ -1,14 +1,28 @@
 # app/config.py
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import List
+from typing import Dict, List
 import os
 
 class Settings(BaseSettings):
     DATABASE_URL: str
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
+    # Key rotation: SECRET_KEY signs new tokens under JWT_ACTIVE_KID,
+    # JWT_PREVIOUS_KEYS ({kid: secret}) still verifies tokens signed before a rotation
+    JWT_ACTIVE_KID: str = "default"
+    JWT_PREVIOUS_KEYS: Dict[str, str] = {}
+    TOKEN_CACHE_SIZE: int = 4096
+    # Multi-worker runner (python -m app.serve); WORKERS=0 starts one worker per CPU
+    WORKERS: int = 0
+    # The runner creates tables once up front and turns this off for its workers
+    CREATE_TABLES_ON_STARTUP: bool = True
+    GRACEFUL_SHUTDOWN_SECONDS: int = 30
+    # Shared log file that keeps per-worker caches coherent; empty means a file in the temp dir
+    INVALIDATION_CHANNEL_PATH: str = ""
+    INVALIDATION_POLL_SECONDS: float = 0.5
     OTP_EXPIRE_SECONDS: int = 300
     OTP_LENGTH: int = 6
     DEBUG_RETURN_OTP: bool = True
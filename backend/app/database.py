@@ -4,10 +4,25 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 from app.config import settings
 
 DATABASE_URL = settings.DATABASE_URL
-engine = create_async_engine(DATABASE_URL, echo=False, future=True)
-AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+# The engine is created per worker process (see init_engine) so connection
+# pools are never shared across forked or spawned workers.
+engine = None
+AsyncSessionLocal = sessionmaker(class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
 
+def init_engine():
+    global engine
+    if engine is None:
+        engine = create_async_engine(DATABASE_URL, echo=False, future=True, pool_pre_ping=True)
+        AsyncSessionLocal.configure(bind=engine)
+    return engine
+
+async def dispose_engine():
+    global engine
+    if engine is not None:
+        await engine.dispose()
+        engine = None
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
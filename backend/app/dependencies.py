@@ -1,20 +1,30 @@
 # app/dependencies.py
 from fastapi import Depends, Header, HTTPException
-from app.auth import decode_access_token
+from app.auth import decode_token, role_claims_current
 from app.database import get_db
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app import models
 
-async def get_current_user(authorization: str = Header(None), db: AsyncSession = Depends(get_db)):
+class TokenUser:
+    """Authenticated caller built from access-token claims alone (no DB lookup)."""
+
+    def __init__(self, id: str, roles):
+        self.id = id
+        self._roles = list(roles)
+
+def _bearer_claims(authorization: str):
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing authorization header")
     if not authorization.lower().startswith("bearer "):
         raise HTTPException(status_code=401, detail="Invalid auth scheme")
     token = authorization.split(" ", 1)[1].strip()
-    sub = decode_access_token(token)
-    if not sub:
+    payload = decode_token(token)
+    if not payload or not payload.get("sub"):
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+    return payload
+
+async def _load_user(sub: str, db: AsyncSession):
     q = select(models.User).where(models.User.id == sub)
     r = await db.execute(q)
     user = r.scalars().first()
@@ -26,8 +36,22 @@ async def get_current_user(authorization: str = Header(None), db: AsyncSession =
     user._roles = roles
     return user
 
+async def get_current_user(authorization: str = Header(None), db: AsyncSession = Depends(get_db)):
+    payload = _bearer_claims(authorization)
+    return await _load_user(payload["sub"], db)
+
+async def get_token_user(authorization: str = Header(None), db: AsyncSession = Depends(get_db)):
+    # Fast path: access tokens carry their roles, so only legacy tokens and users
+    # whose roles changed since issue hit the DB.
+    # The session is lazy and opens no connection unless _load_user runs.
+    payload = _bearer_claims(authorization)
+    roles = payload.get("roles")
+    if roles is None or not role_claims_current(payload):
+        return await _load_user(payload["sub"], db)
+    return TokenUser(payload["sub"], roles)
+
 def require_roles(*allowed_roles: str):
-    async def role_checker(user = Depends(get_current_user)):
+    async def role_checker(user = Depends(get_token_user)):
         user_roles = getattr(user, "_roles", [])
         if not any(r in allowed_roles for r in user_roles):
             raise HTTPException(status_code=403, detail="Insufficient role")
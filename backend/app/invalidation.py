@@ -0,0 +1,107 @@
+# app/invalidation.py
+"""Cross-process cache invalidation channel.
+
+Every worker appends messages to one shared log file and tails it, so a cache
+entry dropped in one worker is dropped in all of them. This is a single-host
+stand-in; a Redis pub/sub or Postgres LISTEN/NOTIFY channel can replace it
+behind the same publish/subscribe calls. Appends rely on POSIX O_APPEND
+semantics; on Windows concurrent publishes may interleave.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import defaultdict
+from app.config import settings
+
+logger = logging.getLogger("uvicorn")
+
+def channel_path(port: int = None) -> str:
+    if settings.INVALIDATION_CHANNEL_PATH:
+        return settings.INVALIDATION_CHANNEL_PATH
+    # Scoped to the database and port so separate deployments on one host
+    # never share, or reset, each other's log
+    digest = hashlib.sha256(f"{settings.DATABASE_URL}|{port}".encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"meal-link-invalidation-{digest}.log")
+
+class InvalidationChannel:
+    def __init__(self, path: str, poll_seconds: float):
+        self.path = path
+        self.poll_seconds = poll_seconds
+        self._handlers = defaultdict(list)
+        self._offset = 0
+        self._partial = b""
+        self._task = None
+
+    def subscribe(self, topic: str, handler):
+        self._handlers[topic].append(handler)
+
+    def _dispatch(self, topic: str, key: str):
+        for handler in self._handlers.get(topic, []):
+            try:
+                handler(key)
+            except Exception:
+                logger.exception(f"invalidation handler failed for topic={topic}")
+
+    def publish(self, topic: str, key: str):
+        # Apply locally right away; other workers pick it up on their next poll
+        self._dispatch(topic, key)
+        line = json.dumps({"pid": os.getpid(), "topic": topic, "key": key}) + "\n"
+        # On POSIX a single O_APPEND write of a short line is atomic across processes
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, line.encode())
+        finally:
+            os.close(fd)
+
+    def poll(self):
+        try:
+            with open(self.path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < self._offset:
+                    # Log was reset by the runner; start over
+                    self._offset, self._partial = 0, b""
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        self._offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        pid = os.getpid()
+        for raw in lines:
+            try:
+                msg = json.loads(raw)
+            except ValueError:
+                continue
+            if msg.get("pid") != pid:
+                self._dispatch(msg.get("topic"), msg.get("key"))
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.poll_seconds)
+            self.poll()
+
+    def start(self):
+        # Replay the whole log: a user-roles mark matters for as long as any access
+        # token issued before it can be live, including across a restart. Replaying
+        # an old mark only costs an extra DB check, since handlers stamp receipt time.
+        self._offset, self._partial = 0, b""
+        self.poll()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+def reset_channel(path: str):
+    """Truncate the shared log; called once by the runner before workers start."""
+    open(path, "wb").close()
+
+channel = InvalidationChannel(channel_path(), settings.INVALIDATION_POLL_SECONDS)
@@ -1,11 +1,32 @@
 # app/main.py
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.database import engine, Base
+from app import auth as auth_tokens
+from app.database import init_engine, dispose_engine, Base
+from app.invalidation import channel
 from app.routers import auth, users, donations, orphanages, volunteers
 
-app = FastAPI(title="Meal Link Connect - Backend")
+# Subscribed at import so repeated lifespan runs (tests, reloads) don't stack handlers
+channel.subscribe("user-roles", auth_tokens.mark_roles_changed)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs once per worker process: each worker owns its engine and channel polling task
+    engine = init_engine()
+    if settings.CREATE_TABLES_ON_STARTUP:
+        # Create tables in dev if not using Alembic
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    channel.start()
+    yield
+    # Uvicorn has already drained in-flight requests by the time shutdown runs
+    await channel.stop()
+    await dispose_engine()
+
+app = FastAPI(title="Meal Link Connect - Backend", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -23,8 +44,6 @@ app.include_router(donations.router, prefix="/donations", tags=["Donations"])
 app.include_router(orphanages.router, prefix="/orphanages", tags=["Orphanages"])
 app.include_router(volunteers.router, prefix="/volunteers", tags=["Volunteers"])
 
-@app.on_event("startup")
-async def startup():
-    # Create tables in dev if not using Alembic
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+@app.get("/health", tags=["Health"])
+async def health():
+    return {"status": "ok", "pid": os.getpid()}
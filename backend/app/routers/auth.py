@@ -126,18 +126,43 @@ async def verify_otp(payload: schemas.VerifyOTPIn, db: AsyncSession = Depends(ge
     
     await db.commit()
 
+    roles = await _login_roles(user.id, db)
+    return _issue_tokens(user.id, roles)
+
+async def _login_roles(user_id: str, db: AsyncSession):
     # Login Check: If user is an orphanage, check approval status
     # We need to check the user's role and if it's orphanage, check the orphanage table
-    q_role = select(models.user_roles_table.c.role).where(models.user_roles_table.c.user_id == user.id)
+    q_role = select(models.user_roles_table.c.role).where(models.user_roles_table.c.user_id == user_id)
     r_role = await db.execute(q_role)
     roles = r_role.scalars().all()
 
     if "orphanage" in roles:
-        q_org = select(models.Orphanage).where(models.Orphanage.user_id == user.id)
+        q_org = select(models.Orphanage).where(models.Orphanage.user_id == user_id)
         r_org = await db.execute(q_org)
         org = r_org.scalars().first()
         if org and not org.approved:
-             raise HTTPException(status_code=403, detail="Account pending admin approval.")
+            raise HTTPException(status_code=403, detail="Account pending admin approval.")
+    return roles
+
+def _issue_tokens(user_id: str, roles):
+    return {
+        "access_token": auth.create_access_token(user_id, roles=roles),
+        "refresh_token": auth.create_refresh_token(user_id),
+        "token_type": "bearer",
+    }
+
+@router.post("/refresh", response_model=schemas.TokenOut)
+async def refresh(payload: schemas.RefreshIn, db: AsyncSession = Depends(get_db)):
+    claims = auth.decode_token(payload.refresh_token, auth.REFRESH_TOKEN_TYPE)
+    if not claims:
+        raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
+
+    q = select(models.User).where(models.User.id == claims.get("sub"))
+    r = await db.execute(q)
+    user = r.scalars().first()
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
 
-    token = auth.create_access_token(user.id)
-    return {"access_token": token, "token_type": "bearer"}
\ No newline at end of file
+    # Roles are re-read here so role changes reach the access token on the next refresh
+    roles = await _login_roles(user.id, db)
+    return _issue_tokens(user.id, roles)
@@ -5,6 +5,7 @@ from sqlalchemy import select, insert
 from app.database import get_db
 from app import models, schemas
 from app.dependencies import require_roles, get_current_user
+from app.invalidation import channel
 
 router = APIRouter()
 
@@ -33,4 +34,6 @@ async def assign_role(payload: schemas.AssignRoleIn, admin = Depends(require_rol
     ins = insert(models.user_roles_table).values(user_id=payload.user_id, role=payload.role.value)
     await db.execute(ins)
     await db.commit()
+    # Outstanding access tokens still embed the old roles; make every worker re-check the DB
+    channel.publish("user-roles", payload.user_id)
     return {"ok": True}
@@ -18,8 +18,12 @@ class VerifyOTPIn(BaseModel):
 
 class TokenOut(BaseModel):
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: str = "bearer"
 
+class RefreshIn(BaseModel):
+    refresh_token: str
+
 class MeOut(BaseModel):
     id: str
     phone: str
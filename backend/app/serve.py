@@ -0,0 +1,56 @@
+# app/serve.py
+"""Multi-worker runner: python -m app.serve [--host H] [--port P] [--workers N]
+
+With more than one worker, each uvicorn worker is a spawned process with its
+own settings, engine and invalidation-channel polling task (see
+app.main.lifespan); the runner creates tables once and gives the workers a
+channel log scoped to this database and port. With one worker uvicorn runs
+the app in this process and the lifespan handles table creation itself.
+
+Graceful drain is POSIX-only: on SIGTERM/SIGINT the parent terminates its
+workers, and each one stops accepting connections, finishes in-flight
+requests (up to GRACEFUL_SHUTDOWN_SECONDS) and then disposes its connection
+pool. On Windows, process termination is TerminateProcess, which kills
+workers without draining or disposing pools.
+"""
+import argparse
+import asyncio
+import os
+import uvicorn
+from app.config import settings
+from app.database import init_engine, dispose_engine, Base
+from app.invalidation import channel_path, reset_channel
+
+async def _create_tables():
+    engine = init_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await dispose_engine()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the backend with multiple worker processes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=settings.WORKERS or os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    if args.workers > 1:
+        # Run schema creation once here instead of racing it in every worker.
+        # Spawned workers re-read settings, so the env overrides reach them.
+        if settings.CREATE_TABLES_ON_STARTUP:
+            asyncio.run(_create_tables())
+        os.environ["CREATE_TABLES_ON_STARTUP"] = "false"
+        path = channel_path(args.port)
+        os.environ["INVALIDATION_CHANNEL_PATH"] = path
+        reset_channel(path)
+
+    uvicorn.run(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_SECONDS,
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Throughput scaling benchmark for the multi-worker runner.
+
+Starts `python -m app.serve` with 1, 2, 4, ... workers (up to the CPU count),
+drives GET /health from several client processes and prints requests/second
+and scaling efficiency against the single-worker run. Each server is stopped
+with SIGTERM, exercising the graceful drain path on POSIX; on Windows
+send_signal(SIGTERM) is TerminateProcess, so workers are killed without a drain.
+
+Run from the backend directory: python bench_workers.py [--seconds S] [--clients C]
+The load generator shares the host with the server, so leave cores free for it
+when reading the numbers. /health touches no database, so no Postgres is needed.
+"""
+import argparse
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+import httpx
+
+def _client(args):
+    url, seconds = args
+    count = 0
+    deadline = time.perf_counter() + seconds
+    with httpx.Client() as client:
+        while time.perf_counter() < deadline:
+            client.get(url)
+            count += 1
+    return count
+
+def _wait_ready(url, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not become ready")
+
+def run(workers, port, seconds, clients):
+    env = dict(os.environ, CREATE_TABLES_ON_STARTUP="false")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "app.serve", "--port", str(port), "--workers", str(workers)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/health"
+    try:
+        _wait_ready(url)
+        with multiprocessing.Pool(clients) as pool:
+            total = sum(pool.map(_client, [(url, seconds)] * clients))
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        code = proc.wait(timeout=60)
+    return total / seconds, code
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--clients", type=int, default=0, help="client processes (default 2 x max workers)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-workers", type=int, default=0, help="largest worker count (default CPU count)")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    max_workers = args.max_workers or cpus
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    clients = args.clients or 2 * counts[-1]
+
+    print(f"cpus={cpus} clients={clients} seconds={args.seconds}")
+    base = None
+    for workers in counts:
+        rps, code = run(workers, args.port, args.seconds, clients)
+        base = base or rps
+        efficiency = rps / (base * workers) * 100
+        print(f"workers={workers:<3} {rps:10.0f} req/s  speedup={rps / base:5.2f}x  "
+              f"efficiency={efficiency:5.1f}%  exit={code}")
+
+if __name__ == "__main__":
+    main()
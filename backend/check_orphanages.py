@@ -1,10 +1,11 @@
 import asyncio
-from app.database import AsyncSessionLocal
+from app.database import AsyncSessionLocal, init_engine, dispose_engine
 from app.models import Orphanage, User, RoleEnum, user_roles_table
 from sqlalchemy import select, insert
 import uuid
 
 async def check_and_seed():
+    init_engine()
     async with AsyncSessionLocal() as db:
         # Check for orphanages
         q = select(Orphanage)
@@ -37,6 +38,7 @@ async def check_and_seed():
         else:
             for org in orphanages:
                 print(f" - {org.name} (Approved: {org.approved})")
+    await dispose_engine()
 
 if __name__ == "__main__":
     asyncio.run(check_and_seed())
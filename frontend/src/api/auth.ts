@@ -3,6 +3,7 @@ import api from './axios';
 
 export interface LoginResponse {
   access_token: string;
+  refresh_token?: string;
   token_type: string;
 }
 
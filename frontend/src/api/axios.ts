@@ -21,4 +21,48 @@ api.interceptors.request.use(
   }
 );
 
+// Access tokens are short-lived: on a 401, swap the refresh token for a new pair once and retry.
+let refreshing: Promise<string | null> | null = null;
+
+const refreshAccessToken = async (): Promise<string | null> => {
+  const refreshToken = localStorage.getItem('refresh_token');
+  if (!refreshToken) return null;
+  try {
+    const response = await axios.post(`${api.defaults.baseURL}/auth/refresh`, { refresh_token: refreshToken });
+    localStorage.setItem('access_token', response.data.access_token);
+    if (response.data.refresh_token) {
+      localStorage.setItem('refresh_token', response.data.refresh_token);
+    }
+    return response.data.access_token;
+  } catch (error) {
+    // Only a rejected refresh token ends the session; network errors and 5xx
+    // (e.g. a deploy restart) keep it so a later request can retry.
+    if (axios.isAxiosError(error) && error.response?.status === 401) {
+      localStorage.removeItem('access_token');
+      localStorage.removeItem('refresh_token');
+    }
+    return null;
+  }
+};
+
+api.interceptors.response.use(
+  (response) => response,
+  async (error) => {
+    const original = error.config;
+    if (error.response?.status !== 401 || !original || original._retry) {
+      return Promise.reject(error);
+    }
+    original._retry = true;
+    refreshing = refreshing ?? refreshAccessToken().finally(() => {
+      refreshing = null;
+    });
+    const token = await refreshing;
+    if (!token) {
+      return Promise.reject(error);
+    }
+    original.headers.Authorization = `Bearer ${token}`;
+    return api(original);
+  }
+);
+
 export default api;
\ No newline at end of file
@@ -74,6 +74,9 @@ const Auth = () => {
 
       // Store Token
       localStorage.setItem("access_token", data.access_token);
+      if (data.refresh_token) {
+        localStorage.setItem("refresh_token", data.refresh_token);
+      }
       toast.success("Authentication successful!");
 
       // Route based on User Type (or verify from backend response in future)
@@ -85,6 +85,9 @@ const Auth = () => {
       );
 
       localStorage.setItem("access_token", data.access_token);
+      if (data.refresh_token) {
+        localStorage.setItem("refresh_token", data.refresh_token);
+      }
       toast.success("Login successful!");
 
       const routes: Record<string, string> = {